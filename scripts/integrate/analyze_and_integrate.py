@@ -4,17 +4,133 @@ Service Integration Tool for n8n-installer
 Analyzes GitHub repositories and integrates them following n8n-installer patterns
 """
 
+import functools
 import os
 import sys
 import json
 import subprocess
+import tarfile
 import tempfile
 import shutil
 import re
+import string
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import argparse
 
+try:
+    import yaml
+    _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+except ImportError:
+    yaml = None
+    _YAML_LOADER = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Precompiled patterns shared by the analyze_* methods (compiled once at import
+# instead of on every call)
+_EXPOSE_RE = re.compile(r'EXPOSE\s+(\d+)')
+_DOCKER_ENV_RE = re.compile(r'ENV\s+([A-Z_]+)')
+_SERVICE_RE = re.compile(r'^\s{2}(\w+):', re.MULTILINE)
+_IMAGE_RE = re.compile(r'image:\s+(.+)')
+_PORT_RE = re.compile(r'- ["\']?(\d+):')
+_ENV_SECTION_END_RE = re.compile(r'\n  [a-z]')
+_ENV_VAR_RE = re.compile(r'- ([A-Z_]+)(?:=|:)')
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_README_ENV_SECTION_RE = re.compile(r'##?\s+Environment Variables(.*?)(?=\n##?\s+|\Z)', re.DOTALL | re.IGNORECASE)
+_BACKTICK_ENV_RE = re.compile(r'`([A-Z_]+)`')
+_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
+_DEPS_RE = re.compile(r'postgres|redis|mysql|mariadb')
+
+# Anchor patterns for the add_to_* shell-file rewrites. The wizard and
+# secrets anchors fold their outline/docmost candidates into one
+# alternation so a single scan finds whichever is present.
+_WIZARD_ANCHOR_RE = re.compile(r'"(?:outline|docmost)" "[^"]*"')
+_WIZARD_FALLBACK_RE = re.compile(r'(\nbase_services_data=\([^)]+)')
+_SECRETS_ANCHOR_RE = re.compile(r'\["(?:OUTLINE|DOCMOST)_APP_SECRET"\]="hex:64"[^\n]*')
+_SECRETS_FALLBACK_RE = re.compile(r'(\n\))')
+
+# Static block skeletons compiled once; substitution is cheaper than
+# rebuilding the triple-quoted f-strings per service in batch runs
+_ENV_BLOCK_TPL = string.Template("""
+############
+# $display Configuration
+# $desc
+############
+${up}_HOSTNAME=$hostname.yourdomain.com
+${up}_APP_SECRET=
+""")
+_CADDY_BLOCK_TPL = string.Template("""
+# $display
+{${up}_HOSTNAME} {
+    reverse_proxy $name:$port
+}
+""")
+_COMPOSE_BLOCK_TPL = string.Template("""
+  $name:
+    image: $image
+    container_name: $name
+    profiles: ["$name"]
+    restart: unless-stopped
+    environment:
+      APP_URL: $${${up}_HOSTNAME:+https://}$${${up}_HOSTNAME}
+""")
+_REPORT_BLOCK_TPL = string.Template("""
+if is_profile_active "$name"; then
+  echo
+  echo "================================= $display ============================"
+  echo
+  echo "Host: $${$hostenv:-<hostname_not_set>}"
+  echo "Description: $desc"
+  echo
+  echo "First Time Setup:"
+  echo "  - Visit https://$${$hostenv:-<hostname_not_set>}"
+  echo "  - Create your admin account"
+fi
+""")
+
+# Read caps: everything the analyzers extract (title, description, services,
+# env sections) lives in the head of the file, so bound the slurp instead of
+# loading a potentially multi-MB generated file.
+_README_READ_CAP = 256 * 1024
+_COMPOSE_READ_CAP = 128 * 1024
+
+# The only top-level files the analyzers ever read (lowercased for matching)
+_ANALYZED_FILES = frozenset({
+    'dockerfile',
+    'docker-compose.yml',
+    'docker-compose.yaml',
+    'readme.md',
+    'readme',
+    'readme.txt',
+    'package.json',
+})
+
+def _atomic_write_text(target: Path, content: str):
+    """Write content to a sibling tmp file and rename it into place.
+
+    os.replace is atomic on POSIX, so a crash mid-write can never leave a
+    half-rewritten install script or compose file behind.
+    """
+    tmp = target.with_name(target.name + '.tmp')
+    tmp.write_text(content)
+    os.replace(tmp, target)
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path: str, limit: int = -1) -> str:
+    """Read up to limit bytes of a file, memoized so repeated analyzer
+    passes over the same file (e.g. batch mode) cost one read"""
+    with open(path, 'rb') as f:
+        return f.read(limit).decode('utf-8', 'replace')
+
 class Colors:
     RED = '\033[0;31m'
     GREEN = '\033[0;32m'
@@ -22,44 +138,102 @@ class Colors:
     BLUE = '\033[0;34m'
     NC = '\033[0m'
 
+# Escape codes are noise when output is piped (CI logs, redirects); blank
+# them once at import when stdout is not a terminal.
+if not sys.stdout.isatty():
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = Colors.NC = ''
+
 class ServiceAnalyzer:
     def __init__(self, github_url: str):
         self.github_url = github_url
-        self.repo_name = Path(github_url).stem
-        self.repo_owner = github_url.split('/')[-2]
+        # urlsplit parses the URL once; rpartition peels off the last two
+        # path components without allocating a list of every segment
+        url_path = urlsplit(github_url).path.strip('/')
+        owner_part, _, repo = url_path.rpartition('/')
+        self.repo_name = repo[:-4] if repo.endswith('.git') else repo
+        self.repo_owner = owner_part.rpartition('/')[2]
         self.temp_dir = None
         self.analysis = {}
 
     def clone_repo(self) -> Path:
-        """Clone repository for analysis"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Fetch repository files for analysis"""
+        # Prefer tmpfs so the fetched files never touch the block device;
+        # /tmp can be disk-backed on CI runners. Falls back to the platform
+        # default when /dev/shm is unavailable.
+        tmp_root = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+        self.temp_dir = Path(tempfile.mkdtemp(dir=tmp_root))
         repo_path = self.temp_dir / self.repo_name
 
-        print(f"{Colors.YELLOW}Cloning repository...{Colors.NC}")
+        print(f"{Colors.YELLOW}Fetching repository...{Colors.NC}")
+
+        # Prefer the GitHub tarball endpoint: it streams only tens of KB for
+        # the handful of files we analyze, instead of every blob at HEAD.
+        if self._fetch_tarball(repo_path):
+            print(f"{Colors.GREEN}✓ Repository files fetched{Colors.NC}\n")
+            return repo_path
+
+        # Fallback: partial shallow clone (non-GitHub hosts, private repos,
+        # no network API). --filter=blob:none defers blob downloads and
+        # --sparse checks out only the top-level files, which covers every
+        # file the analyzers read; --single-branch/--no-tags skip extra refs.
         subprocess.run(
-            ['git', 'clone', '--depth', '1', self.github_url, str(repo_path)],
+            ['git', '-c', 'protocol.version=2', 'clone', '--depth=1',
+             '--single-branch', '--no-tags', '--filter=blob:none', '--sparse',
+             self.github_url, str(repo_path)],
             check=True,
-            capture_output=True
+            # The output is never inspected; DEVNULL avoids buffering git's
+            # progress stream into Python strings just to discard them
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         print(f"{Colors.GREEN}✓ Repository cloned{Colors.NC}\n")
         return repo_path
 
-    def analyze_dockerfile(self, repo_path: Path) -> Dict:
+    def _fetch_tarball(self, repo_path: Path) -> bool:
+        """Download only the analyzed files from the GitHub tarball endpoint"""
+        if 'github.com' not in self.github_url:
+            return False
+
+        url = f'https://codeload.github.com/{self.repo_owner}/{self.repo_name}/tar.gz/HEAD'
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                with tarfile.open(fileobj=response, mode='r|gz') as tar:
+                    repo_path.mkdir(parents=True, exist_ok=True)
+                    for member in tar:
+                        # Tarball entries are '<repo>-<ref>/<path>'; keep only
+                        # top-level files the analyzers actually read.
+                        parts = member.name.split('/')
+                        if len(parts) != 2 or not member.isfile():
+                            continue
+                        if parts[1].lower() not in _ANALYZED_FILES:
+                            continue
+                        extracted = tar.extractfile(member)
+                        if extracted:
+                            (repo_path / parts[1]).write_bytes(extracted.read())
+        except (urllib.error.URLError, tarfile.TarError, OSError):
+            return False
+        return True
+
+    def analyze_dockerfile(self, toplevel: Dict[str, Path]) -> Dict:
         """Analyze Dockerfile"""
-        dockerfile = repo_path / 'Dockerfile'
-        if not dockerfile.exists():
+        dockerfile = toplevel.get('dockerfile')
+        if not dockerfile:
             return {}
 
         print(f"{Colors.GREEN}✓ Found Dockerfile{Colors.NC}")
 
-        with open(dockerfile) as f:
-            content = f.read()
-
-        # Extract exposed ports
-        ports = re.findall(r'EXPOSE\s+(\d+)', content)
+        content = _read_text(str(dockerfile))
 
-        # Extract environment variables
-        env_vars = re.findall(r'ENV\s+([A-Z_]+)', content)
+        # One line-oriented pass; EXPOSE/ENV are literal prefixes, so the
+        # regexes only run on the lines that can match instead of walking
+        # the whole file once per pattern
+        ports = []
+        env_vars = []
+        for line in content.splitlines():
+            if line.startswith('EXPOSE'):
+                ports.extend(_EXPOSE_RE.findall(line))
+            elif line.startswith('ENV'):
+                env_vars.extend(_DOCKER_ENV_RE.findall(line))
 
         return {
             'has_dockerfile': True,
@@ -67,44 +241,28 @@ class ServiceAnalyzer:
             'env_vars': env_vars
         }
 
-    def analyze_docker_compose(self, repo_path: Path) -> Dict:
+    def analyze_docker_compose(self, toplevel: Dict[str, Path]) -> Dict:
         """Analyze docker-compose.yml"""
-        compose_files = ['docker-compose.yml', 'docker-compose.yaml']
-        compose_file = None
-
-        for cf in compose_files:
-            if (repo_path / cf).exists():
-                compose_file = repo_path / cf
-                break
-
+        compose_file = (toplevel.get('docker-compose.yml')
+                        or toplevel.get('docker-compose.yaml'))
         if not compose_file:
             return {}
 
         print(f"{Colors.GREEN}✓ Found docker-compose: {compose_file.name}{Colors.NC}")
 
-        with open(compose_file) as f:
-            content = f.read()
+        content = _read_text(str(compose_file), _COMPOSE_READ_CAP)
 
-        # Extract services
-        services = re.findall(r'^\s{2}(\w+):', content, re.MULTILINE)
-
-        # Extract image
-        image_match = re.search(r'image:\s+(.+)', content)
-        image = image_match.group(1).strip() if image_match else None
-
-        # Extract ports
-        ports = re.findall(r'- ["\']?(\d+):', content)
-
-        # Extract environment variables
-        env_section = re.search(r'environment:(.*?)(?=\n  [a-z]|\Z)', content, re.DOTALL)
-        env_vars = []
-        if env_section:
-            env_vars = re.findall(r'- ([A-Z_]+)(?:=|:)', env_section.group(1))
+        # Oversized files would be truncated by the read cap into invalid
+        # YAML anyway, so go straight to the regex scrape for those
+        use_yaml = compose_file.stat().st_size <= _COMPOSE_READ_CAP
+        services, image, ports, env_vars = self._parse_compose(content, use_yaml)
 
-        # Check dependencies
-        needs_postgres = 'postgres' in content.lower()
-        needs_redis = 'redis' in content.lower()
-        needs_mysql = 'mysql' in content.lower() or 'mariadb' in content.lower()
+        # Check dependencies: lowercase once and find all dependency names
+        # in a single alternation scan instead of one substring pass each
+        found = set(_DEPS_RE.findall(content.lower()))
+        needs_postgres = 'postgres' in found
+        needs_redis = 'redis' in found
+        needs_mysql = 'mysql' in found or 'mariadb' in found
 
         return {
             'has_docker_compose': True,
@@ -118,41 +276,99 @@ class ServiceAnalyzer:
             'needs_mysql': needs_mysql
         }
 
-    def analyze_readme(self, repo_path: Path) -> Dict:
+    @staticmethod
+    def _parse_compose(content: str, use_yaml: bool = True):
+        """Extract services/image/ports/env vars from compose file content.
+
+        Parses the YAML in one pass when PyYAML is available (correct for
+        quoted and multi-line values); falls back to regex scraping when
+        PyYAML is missing or the caller knows the content is truncated.
+        """
+        if yaml is not None and use_yaml:
+            try:
+                doc = yaml.load(content, Loader=_YAML_LOADER)
+            except yaml.YAMLError:
+                doc = None
+            if isinstance(doc, dict) and isinstance(doc.get('services'), dict):
+                service_defs = doc['services']
+                services = list(service_defs.keys())
+                image = None
+                ports = []
+                env_vars = []
+                for svc in service_defs.values():
+                    if not isinstance(svc, dict):
+                        continue
+                    if image is None and svc.get('image'):
+                        image = str(svc['image'])
+                    for mapping in svc.get('ports') or []:
+                        host_port = str(mapping).split(':')[0].strip('"\'')
+                        if host_port.isdigit():
+                            ports.append(host_port)
+                    environment = svc.get('environment')
+                    if isinstance(environment, dict):
+                        env_vars.extend(environment.keys())
+                    elif isinstance(environment, list):
+                        env_vars.extend(
+                            str(e).split('=')[0] for e in environment if e
+                        )
+                return services, image, ports, env_vars
+
+        # Fallback: regex scrape (PyYAML missing or file is not valid YAML)
+        services = _SERVICE_RE.findall(content)
+        image_match = _IMAGE_RE.search(content)
+        image = image_match.group(1).strip() if image_match else None
+        ports = _PORT_RE.findall(content)
+        # Locate the environment block with a literal find, then scan for
+        # the next 2-space-indented key; linear, unlike the old lazy-dot
+        # pattern that could backtrack quadratically on long files
+        env_vars = []
+        idx = content.find('environment:')
+        if idx != -1:
+            section = content[idx + len('environment:'):]
+            end = _ENV_SECTION_END_RE.search(section)
+            if end:
+                section = section[:end.start()]
+            env_vars = _ENV_VAR_RE.findall(section)
+        return services, image, ports, env_vars
+
+    def analyze_readme(self, toplevel: Dict[str, Path]) -> Dict:
         """Analyze README for service information"""
-        readme_files = ['README.md', 'readme.md', 'README', 'README.txt']
-        readme = None
-
-        for rf in readme_files:
-            if (repo_path / rf).exists():
-                readme = repo_path / rf
-                break
-
+        readme = (toplevel.get('readme.md') or toplevel.get('readme')
+                  or toplevel.get('readme.txt'))
         if not readme:
             return {}
 
         print(f"{Colors.GREEN}✓ Found README: {readme.name}{Colors.NC}")
 
-        with open(readme) as f:
-            content = f.read()
+        content = _read_text(str(readme), _README_READ_CAP)
 
         # Extract title
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = _TITLE_RE.search(content)
         title = title_match.group(1) if title_match else self.repo_name
 
-        # Extract description (first paragraph)
-        desc_match = re.search(r'\n\n(.+?)(?:\n\n|\Z)', content, re.DOTALL)
-        description = desc_match.group(1).strip() if desc_match else ""
+        # Extract description (first paragraph after the title); a plain
+        # split is linear, unlike a lazy-dot regex that can backtrack badly
+        # on large READMEs
+        parts = content.split('\n\n', 2)
+        description = parts[1].strip() if len(parts) > 1 else ""
         description = ' '.join(description.split('\n')[:3])[:200]
 
+        lowered = content.lower()
+
         # Look for docker instructions
-        has_docker_section = 'docker' in content.lower()
+        has_docker_section = 'docker' in lowered
 
-        # Look for environment variables section
-        env_section = re.search(r'##?\s+Environment Variables(.*?)(?=\n##?\s+|\Z)', content, re.DOTALL | re.IGNORECASE)
+        # Look for environment variables section: a literal find short-
+        # circuits READMEs without one before any regex runs, and the
+        # section pattern then scans only a bounded window around the
+        # heading instead of lazy-dotting across the whole file
         env_vars_documented = []
-        if env_section:
-            env_vars_documented = re.findall(r'`([A-Z_]+)`', env_section.group(1))
+        idx = lowered.find('environment variables')
+        if idx != -1:
+            window = content[max(0, idx - 8):idx + 4096]
+            env_section = _README_ENV_SECTION_RE.search(window)
+            if env_section:
+                env_vars_documented = _BACKTICK_ENV_RE.findall(env_section.group(1))
 
         return {
             'title': title,
@@ -161,14 +377,20 @@ class ServiceAnalyzer:
             'documented_env_vars': env_vars_documented
         }
 
-    def analyze_package_json(self, repo_path: Path) -> Dict:
+    def analyze_package_json(self, toplevel: Dict[str, Path]) -> Dict:
         """Analyze package.json for Node.js projects"""
-        package_json = repo_path / 'package.json'
-        if not package_json.exists():
+        package_json = toplevel.get('package.json')
+        if not package_json:
             return {}
 
-        with open(package_json) as f:
-            data = json.load(f)
+        # Monorepos occasionally ship multi-MB package.json files; only
+        # name/description/version are used, so don't parse outliers
+        if package_json.stat().st_size > 1_000_000:
+            return {'is_nodejs': True}
+
+        # orjson when available (bytes in, SIMD parse); stdlib json otherwise
+        with open(package_json, 'rb') as f:
+            data = _json_loads(f.read())
 
         return {
             'name': data.get('name'),
@@ -184,63 +406,110 @@ class ServiceAnalyzer:
 
         repo_path = self.clone_repo()
 
-        # Run all analyses
+        # One readdir instead of a stat per candidate filename; keys are
+        # lowercased so README/readme.md lookups are case-insensitive.
+        # os.scandir reuses the dirent type info, avoiding a stat per entry.
+        with os.scandir(repo_path) as entries:
+            toplevel = {
+                e.name.lower(): Path(e.path) for e in entries
+                if e.name.lower() in _ANALYZED_FILES and e.is_file()
+            }
+
         self.analysis = {
             'repo_name': self.repo_name,
             'repo_owner': self.repo_owner,
             'github_url': self.github_url,
-            **self.analyze_dockerfile(repo_path),
-            **self.analyze_docker_compose(repo_path),
-            **self.analyze_readme(repo_path),
-            **self.analyze_package_json(repo_path)
         }
 
+        # No Docker support at all: the directory listing already proves it,
+        # so report the rejection without opening a single file.
+        if not ({'dockerfile', 'docker-compose.yml', 'docker-compose.yaml'} & toplevel.keys()):
+            self.analysis.update({'has_dockerfile': False, 'has_docker_compose': False})
+            return self.analysis
+
+        # Docker support first: if the repo has neither a Dockerfile nor a
+        # compose file, main() rejects it immediately, so don't pay for the
+        # README and package.json passes. One executor serves both phases
+        # rather than spinning up a fresh thread pool per batch.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self._run_analyzers(
+                executor, [self.analyze_dockerfile, self.analyze_docker_compose], toplevel
+            )
+
+            if self.analysis.get('has_dockerfile') or self.analysis.get('has_docker_compose'):
+                self._run_analyzers(
+                    executor, [self.analyze_readme, self.analyze_package_json], toplevel
+                )
+
         return self.analysis
 
+    def _run_analyzers(self, executor: ThreadPoolExecutor, analyzers: List,
+                       toplevel: Dict[str, Path]):
+        """Run analyzers concurrently and merge their results.
+
+        Each analyzer reads a different file and returns an independent
+        dict, so the file I/O overlaps across threads.
+        """
+        futures = [executor.submit(fn, toplevel) for fn in analyzers]
+        for future in futures:
+            self.analysis.update(future.result())
+
     def cleanup(self):
         """Clean up temporary files"""
         if self.temp_dir and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
 
 class ServiceIntegrator:
-    def __init__(self, analysis: Dict, project_root: Path):
+    def __init__(self, analysis: Dict, project_root: Path, auto: bool = False):
         self.analysis = analysis
         self.project_root = project_root
+        self.auto = auto
         self.service_name = None
         self.service_config = {}
+        self._name_upper = None
+        self._hostname_env = None
+        self._secret_env = None
 
     def interactive_config(self):
-        """Get configuration from user"""
-        print(f"\n{Colors.YELLOW}Service Configuration{Colors.NC}\n")
-
-        # Service name
-        default_name = self.analysis['repo_name'].lower().replace('-', '').replace('_', '')
-        self.service_name = input(f"Service name [{default_name}]: ") or default_name
-        self.service_name = re.sub(r'[^a-z0-9-]', '', self.service_name)
-
-        # Display name
+        """Get configuration from user (or take the defaults with --auto)"""
+        # Defaults derived from the analysis; the --auto path uses them
+        # verbatim without touching the TTY
+        default_name = _SANITIZE_RE.sub(
+            '', self.analysis['repo_name'].lower().replace('-', '').replace('_', '')
+        )
         default_display = self.analysis.get('title', self.analysis['repo_name'])
-        display_name = input(f"Display name [{default_display}]: ") or default_display
-
-        # Description
         default_desc = self.analysis.get('description', '') or ''
-        desc_preview = default_desc[:50] if default_desc else 'No description available'
-        description = input(f"Description [{desc_preview}{'...' if len(default_desc) > 50 else ''}]: ") or default_desc
-
-        # Port
         ports_list = self.analysis.get('ports', [])
         default_port = ports_list[0] if ports_list else '3000'
-        port = input(f"Internal port [{default_port}]: ") or default_port
-
-        # Image
         default_image = self.analysis.get('image', f'{self.analysis["repo_owner"]}/{self.analysis["repo_name"]}:latest')
-        image = input(f"Docker image [{default_image}]: ") or default_image
 
-        # Hostname
-        hostname = input(f"Hostname subdomain [{self.service_name}]: ") or self.service_name
+        if self.auto:
+            self.service_name = default_name
+            display_name = default_display
+            description = default_desc
+            port = default_port
+            image = default_image
+            hostname = default_name
+        else:
+            print(f"\n{Colors.YELLOW}Service Configuration{Colors.NC}\n")
+
+            self.service_name = input(f"Service name [{default_name}]: ") or default_name
+            self.service_name = _SANITIZE_RE.sub('', self.service_name.lower())
+
+            display_name = input(f"Display name [{default_display}]: ") or default_display
+
+            desc_preview = default_desc[:50] if default_desc else 'No description available'
+            description = input(f"Description [{desc_preview}{'...' if len(default_desc) > 50 else ''}]: ") or default_desc
+
+            port = input(f"Internal port [{default_port}]: ") or default_port
+
+            image = input(f"Docker image [{default_image}]: ") or default_image
+
+            hostname = input(f"Hostname subdomain [{self.service_name}]: ") or self.service_name
 
         self.service_config = {
             'name': self.service_name,
+            'name_upper': self.service_name.upper(),
             'display_name': display_name,
             'description': description,
             'port': port,
@@ -250,10 +519,18 @@ class ServiceIntegrator:
             'needs_redis': self.analysis.get('needs_redis', False)
         }
 
-        # Show summary
-        print(f"\n{Colors.YELLOW}Summary:{Colors.NC}")
-        for key, value in self.service_config.items():
-            print(f"  {key}: {value}")
+        # Derived strings reused across the add_to_* methods
+        self._name_upper = self.service_config['name_upper']
+        self._hostname_env = f'{self._name_upper}_HOSTNAME'
+        self._secret_env = f'{self._name_upper}_APP_SECRET'
+
+        # Show summary with one buffered write instead of a print per field
+        sys.stdout.write(f"\n{Colors.YELLOW}Summary:{Colors.NC}\n" + '\n'.join(
+            f"  {key}: {value}" for key, value in self.service_config.items()
+        ) + '\n')
+
+        if self.auto:
+            return True
 
         confirm = input(f"\nProceed? (yes/no): ")
         return confirm.lower() == 'yes'
@@ -264,45 +541,35 @@ class ServiceIntegrator:
 
         docker_compose = self.project_root / 'docker-compose.yml'
 
-        # Build service configuration
-        service_block = f"""
-  {self.service_config['name']}:
-    image: {self.service_config['image']}
-    container_name: {self.service_config['name']}
-    profiles: ["{self.service_config['name']}"]
-    restart: unless-stopped
-    environment:
-      APP_URL: ${{{self.service_config['name'].upper()}_HOSTNAME:+https://}}${{{self.service_config['name'].upper()}_HOSTNAME}}
-"""
+        # Static skeleton rendered from the cached template; only the
+        # conditional depends_on lines are built per service
+        service_block = _COMPOSE_BLOCK_TPL.substitute(
+            name=self.service_config['name'],
+            image=self.service_config['image'],
+            up=self.service_config['name_upper'],
+        )
 
         # Add dependencies
         if self.service_config['needs_postgres'] or self.service_config['needs_redis']:
-            service_block += "    depends_on:\n"
+            lines = ['    depends_on:']
             if self.service_config['needs_postgres']:
-                service_block += "      postgres:\n        condition: service_healthy\n"
+                lines.extend(['      postgres:', '        condition: service_healthy'])
             if self.service_config['needs_redis']:
-                service_block += "      redis:\n        condition: service_healthy\n"
+                lines.extend(['      redis:', '        condition: service_healthy'])
+            service_block += '\n'.join(lines) + '\n'
 
         # Add volume
         volume_name = f"{self.service_config['name']}_data"
 
-        with open(docker_compose, 'a') as f:
-            f.write(service_block)
-
-        # Add volume to volumes section
-        with open(docker_compose, 'r') as f:
-            content = f.read()
-
-        # Find volumes section and add new volume
-        content = re.sub(
-            r'(volumes:\n)',
-            f'\\1  {volume_name}:\n',
-            content,
-            count=1
+        # One read + one write: insert the volume while the content is in
+        # memory, then append the service block before writing back.
+        content = docker_compose.read_text()
+        # Literal pattern: plain str.replace beats a regex sub here
+        content = content.replace(
+            'volumes:\n', f'volumes:\n  {volume_name}:\n', 1
         )
-
-        with open(docker_compose, 'w') as f:
-            f.write(content)
+        content += service_block
+        _atomic_write_text(docker_compose, content)
 
         print(f"{Colors.GREEN}✓ Added to docker-compose.yml{Colors.NC}")
 
@@ -313,16 +580,15 @@ class ServiceIntegrator:
         env_example = self.project_root / '.env.example'
 
         description_line = self.service_config['description'][:100] if self.service_config.get('description') else 'Service configuration'
-        config_block = f"""
-############
-# {self.service_config['display_name']} Configuration
-# {description_line}
-############
-{self.service_config['name'].upper()}_HOSTNAME={self.service_config['hostname']}.yourdomain.com
-{self.service_config['name'].upper()}_APP_SECRET=
-"""
+        config_block = _ENV_BLOCK_TPL.substitute(
+            display=self.service_config['display_name'],
+            desc=description_line,
+            up=self.service_config['name_upper'],
+            hostname=self.service_config['hostname'],
+        )
 
-        with open(env_example, 'a') as f:
+        # Pure append: one open, no re-read
+        with env_example.open('a') as f:
             f.write(config_block)
 
         print(f"{Colors.GREEN}✓ Added to .env.example{Colors.NC}")
@@ -333,14 +599,15 @@ class ServiceIntegrator:
 
         caddyfile = self.project_root / 'config' / 'caddy' / 'Caddyfile'
 
-        caddy_block = f"""
-# {self.service_config['display_name']}
-{{{self.service_config['name'].upper()}_HOSTNAME}} {{
-    reverse_proxy {self.service_config['name']}:{self.service_config['port']}
-}}
-"""
+        caddy_block = _CADDY_BLOCK_TPL.substitute(
+            display=self.service_config['display_name'],
+            up=self.service_config['name_upper'],
+            name=self.service_config['name'],
+            port=self.service_config['port'],
+        )
 
-        with open(caddyfile, 'a') as f:
+        # Pure append: one open, no re-read
+        with caddyfile.open('a') as f:
             f.write(caddy_block)
 
         print(f"{Colors.GREEN}✓ Added to Caddyfile{Colors.NC}")
@@ -351,38 +618,23 @@ class ServiceIntegrator:
 
         wizard_file = self.project_root / 'scripts' / 'install' / '04_wizard.sh'
 
-        with open(wizard_file, 'r') as f:
-            content = f.read()
+        content = wizard_file.read_text()
 
         # Find where to add (after outline or docmost)
         service_line = f'    "{self.service_config["name"]}" "{self.service_config["display_name"]}"\n'
 
-        # Add after outline if it exists, otherwise after docmost
-        if '"outline"' in content:
-            content = re.sub(
-                r'("outline" ".*?")\n',
-                f'\\1\n{service_line}',
-                content,
-                count=1
-            )
-        elif '"docmost"' in content:
-            content = re.sub(
-                r'("docmost" ".*?")\n',
-                f'\\1\n{service_line}',
-                content,
-                count=1
-            )
-        else:
+        # Add after the outline/docmost entry, whichever appears first,
+        # with one alternation scan instead of a cascade of subs
+        content, matched = _WIZARD_ANCHOR_RE.subn(
+            lambda m: f'{m.group(0)}\n{service_line.rstrip()}', content, count=1
+        )
+        if not matched:
             # Fallback: add before closing parenthesis of base_services_data
-            content = re.sub(
-                r'(\nbase_services_data=\([^)]+)',
-                f'\\1\n{service_line}',
-                content,
-                count=1
+            content = _WIZARD_FALLBACK_RE.sub(
+                f'\\1\n{service_line}', content, count=1
             )
 
-        with open(wizard_file, 'w') as f:
-            f.write(content)
+        _atomic_write_text(wizard_file, content)
 
         print(f"{Colors.GREEN}✓ Added to wizard{Colors.NC}")
 
@@ -392,37 +644,22 @@ class ServiceIntegrator:
 
         secrets_file = self.project_root / 'scripts' / 'install' / '03_generate_secrets.sh'
 
-        with open(secrets_file, 'r') as f:
-            content = f.read()
+        content = secrets_file.read_text()
 
-        secret_line = f'    ["{self.service_config["name"].upper()}_APP_SECRET"]="hex:64"\n'
+        secret_line = f'    ["{self._secret_env}"]="hex:64"\n'
 
-        # Add after OUTLINE_APP_SECRET or DOCMOST_APP_SECRET
-        if 'OUTLINE_APP_SECRET' in content:
-            content = re.sub(
-                r'(\["OUTLINE_APP_SECRET"\]="hex:64")\n',
-                f'\\1\n{secret_line}',
-                content,
-                count=1
-            )
-        elif 'DOCMOST_APP_SECRET' in content:
-            content = re.sub(
-                r'(\["DOCMOST_APP_SECRET"\]="hex:64")\n',
-                f'\\1\n{secret_line}',
-                content,
-                count=1
-            )
-        else:
+        # Add after the OUTLINE/DOCMOST secret entry, whichever appears
+        # first, with one alternation scan instead of a cascade of subs
+        content, matched = _SECRETS_ANCHOR_RE.subn(
+            lambda m: f'{m.group(0)}\n{secret_line.rstrip()}', content, count=1
+        )
+        if not matched:
             # Fallback: add before closing parenthesis
-            content = re.sub(
-                r'(\n\))',
-                f'{secret_line}\\1',
-                content,
-                count=1
+            content = _SECRETS_FALLBACK_RE.sub(
+                f'{secret_line}\\1', content, count=1
             )
 
-        with open(secrets_file, 'w') as f:
-            f.write(content)
+        _atomic_write_text(secrets_file, content)
 
         print(f"{Colors.GREEN}✓ Added to secrets{Colors.NC}")
 
@@ -432,61 +669,42 @@ class ServiceIntegrator:
 
         report_file = self.project_root / 'scripts' / 'install' / '07_final_report.sh'
 
-        report_block = f'''
-if is_profile_active "{self.service_config['name']}"; then
-  echo
-  echo "================================= {self.service_config['display_name']} ============================"
-  echo
-  echo "Host: ${{{self.service_config['name'].upper()}_HOSTNAME:-<hostname_not_set>}}"
-  echo "Description: {self.service_config['description']}"
-  echo
-  echo "First Time Setup:"
-  echo "  - Visit https://${{{self.service_config['name'].upper()}_HOSTNAME:-<hostname_not_set>}}"
-  echo "  - Create your admin account"
-fi
-'''
-
-        with open(report_file, 'r') as f:
-            content = f.read()
-
-        # Add after outline section if it exists
-        if 'is_profile_active "outline"' in content:
-            # Find the outline block and add after it
-            content = re.sub(
-                r'(if is_profile_active "outline"; then.*?^fi)',
-                f'\\1\n{report_block}',
-                content,
-                count=1,
-                flags=re.MULTILINE | re.DOTALL
-            )
-        elif 'is_profile_active "docmost"' in content:
-            # Find the docmost block and add after it
-            content = re.sub(
-                r'(if is_profile_active "docmost"; then.*?^fi)',
-                f'\\1\n{report_block}',
-                content,
-                count=1,
-                flags=re.MULTILINE | re.DOTALL
-            )
-        else:
+        report_block = _REPORT_BLOCK_TPL.substitute(
+            name=self.service_config['name'],
+            display=self.service_config['display_name'],
+            desc=self.service_config['description'],
+            hostenv=self._hostname_env,
+        )
+
+        content = report_file.read_text()
+
+        # Add after the outline or docmost block when present. Literal
+        # finds plus a slice splice locate the block end in O(N) without
+        # the DOTALL lazy scan the old patterns performed.
+        inserted = False
+        for anchor in ('if is_profile_active "outline"; then',
+                       'if is_profile_active "docmost"; then'):
+            start = content.find(anchor)
+            if start == -1:
+                continue
+            end = content.find('\nfi\n', start)
+            if end == -1:
+                continue
+            end += len('\nfi\n')
+            content = content[:end] + report_block + content[end:]
+            inserted = True
+            break
+
+        if not inserted:
             # Fallback: add before paddleocr or python-runner
-            if 'is_profile_active "paddleocr"' in content:
-                content = re.sub(
-                    r'(if is_profile_active "paddleocr")',
-                    f'{report_block}\n\\1',
-                    content,
-                    count=1
-                )
-            elif 'is_profile_active "python-runner"' in content:
-                content = re.sub(
-                    r'(if is_profile_active "python-runner")',
-                    f'{report_block}\n\\1',
-                    content,
-                    count=1
-                )
+            for anchor in ('if is_profile_active "paddleocr"',
+                           'if is_profile_active "python-runner"'):
+                idx = content.find(anchor)
+                if idx != -1:
+                    content = content[:idx] + report_block + '\n' + content[idx:]
+                    break
 
-        with open(report_file, 'w') as f:
-            f.write(content)
+        _atomic_write_text(report_file, content)
 
         print(f"{Colors.GREEN}✓ Added to final report{Colors.NC}")
 
@@ -494,27 +712,39 @@ fi
         """Run full integration"""
         print(f"\n{Colors.YELLOW}Integrating into n8n-installer...{Colors.NC}\n")
 
-        self.add_to_docker_compose()
-        self.add_to_env_example()
-        self.add_to_caddyfile()
-        self.add_to_wizard()
-        self.add_to_secrets()
-        self.add_to_final_report()
-
-        print(f"\n{Colors.BLUE}[7/7] Updating README.md...{Colors.NC}")
-        print(f"{Colors.YELLOW}⚠ Manual step required: Add {self.service_config['display_name']} to README.md{Colors.NC}")
-
-        print(f"\n{Colors.GREEN}========================================{Colors.NC}")
-        print(f"{Colors.GREEN}✓ Integration Complete!{Colors.NC}")
-        print(f"{Colors.GREEN}========================================{Colors.NC}\n")
-
-        print(f"{Colors.YELLOW}Next Steps:{Colors.NC}")
-        print("1. Review changes: git diff")
-        print(f"2. Update README.md (manual)")
-        print(f"3. Commit: git commit -am 'Add {self.service_config['display_name']} service'")
-        print(f"4. Push: git push origin main\n")
-
-        print(f"{Colors.BLUE}Test with: docker compose --profile {self.service_config['name']} up -d{Colors.NC}\n")
+        # Each step does one read-modify-write on a distinct file, so the
+        # six edits can overlap on a thread pool.
+        steps = [
+            self.add_to_docker_compose,
+            self.add_to_env_example,
+            self.add_to_caddyfile,
+            self.add_to_wizard,
+            self.add_to_secrets,
+            self.add_to_final_report,
+        ]
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            for future in [executor.submit(step) for step in steps]:
+                future.result()
+
+        # One buffered write instead of a syscall (and stdout lock) per line
+        sys.stdout.write('\n'.join([
+            '',
+            f"{Colors.BLUE}[7/7] Updating README.md...{Colors.NC}",
+            f"{Colors.YELLOW}⚠ Manual step required: Add {self.service_config['display_name']} to README.md{Colors.NC}",
+            '',
+            f"{Colors.GREEN}========================================{Colors.NC}",
+            f"{Colors.GREEN}✓ Integration Complete!{Colors.NC}",
+            f"{Colors.GREEN}========================================{Colors.NC}",
+            '',
+            f"{Colors.YELLOW}Next Steps:{Colors.NC}",
+            "1. Review changes: git diff",
+            "2. Update README.md (manual)",
+            f"3. Commit: git commit -am 'Add {self.service_config['display_name']} service'",
+            "4. Push: git push origin main",
+            '',
+            f"{Colors.BLUE}Test with: docker compose --profile {self.service_config['name']} up -d{Colors.NC}",
+            '',
+        ]) + '\n')
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze and integrate GitHub repos into n8n-installer')
@@ -532,12 +762,15 @@ def main():
     try:
         analysis = analyzer.run_analysis()
 
-        print(f"\n{Colors.YELLOW}Analysis Results:{Colors.NC}")
-        print(f"  Repository: {analysis['repo_name']}")
-        print(f"  Has Docker: {analysis.get('has_dockerfile', False)}")
-        print(f"  Has Compose: {analysis.get('has_docker_compose', False)}")
-        print(f"  Needs PostgreSQL: {analysis.get('needs_postgres', False)}")
-        print(f"  Needs Redis: {analysis.get('needs_redis', False)}")
+        sys.stdout.write('\n'.join([
+            '',
+            f"{Colors.YELLOW}Analysis Results:{Colors.NC}",
+            f"  Repository: {analysis['repo_name']}",
+            f"  Has Docker: {analysis.get('has_dockerfile', False)}",
+            f"  Has Compose: {analysis.get('has_docker_compose', False)}",
+            f"  Needs PostgreSQL: {analysis.get('needs_postgres', False)}",
+            f"  Needs Redis: {analysis.get('needs_redis', False)}",
+        ]) + '\n')
 
         if not analysis.get('has_docker_compose') and not analysis.get('has_dockerfile'):
             print(f"\n{Colors.RED}Error: No Docker support found{Colors.NC}")
@@ -548,7 +781,7 @@ def main():
         project_root = script_dir.parent
 
         # Integrate
-        integrator = ServiceIntegrator(analysis, project_root)
+        integrator = ServiceIntegrator(analysis, project_root, auto=args.auto)
 
         if integrator.interactive_config():
             integrator.integrate()